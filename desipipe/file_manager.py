@@ -142,6 +142,20 @@ def _make_list_options(values):
     return values
 
 
+def _keyword_selector(keywords):
+    """
+    Return function that tells whether input string (e.g. file entry description) contains (case insensitive)
+    all the words of any of the input ``keywords`` (list of lists of words), built once for all strings to test.
+    """
+    keywords = list(dict.fromkeys(tuple(dict.fromkeys(kw.lower() for kw in keyword)) for keyword in keywords))  # unique groups and words, order preserved
+
+    def selector(string):
+        string = string.lower()
+        return any(all(kw in string for kw in keyword) for keyword in keywords)
+
+    return selector
+
+
 def in_options(values, options, return_index=False):
     """Return input values that are in options."""
     if not options:
@@ -818,6 +832,7 @@ class FileEntryCollection(BaseClass):
         if keywords is not None:
             keywords = _make_list_options(keywords)
             keywords = [keyword.lower().split() for keyword in keywords]
+            select_keywords = _keyword_selector(keywords)
         indices, entries = [], []
         not_id, not_filetype, not_keywords, sentries = True, True, True, []
         for ientry, entry in enumerate(self.data):
@@ -827,10 +842,8 @@ class FileEntryCollection(BaseClass):
             if filetype is not None and entry.filetype.lower() not in filetype:
                 continue
             not_filetype = False
-            if keywords is not None:
-                description = entry.description.lower()
-                if not any(all(kw in description for kw in keyword) for keyword in keywords):
-                    continue
+            if keywords is not None and not select_keywords(entry.description):
+                continue
             not_keywords = False
             sentry = entry.select(ignore=ignore, check_exists=False, raise_error=False, **kwargs)
             if sentry is None or not sentry:
@@ -1278,15 +1291,16 @@ class FileManager(FileEntryCollection):
     @classmethod
     def databases(cls, keywords=None):
         """List of paths to available data bases following desipipe's configuration (see :class:`Config`)."""
+        select_keywords = None
         if keywords is not None:
             keywords = _make_list(keywords)
-            keywords = [keyword.lower().split() for keyword in keywords]
+            select_keywords = _keyword_selector([keyword.split() for keyword in keywords])
         from .config import Config
         file = Config().get('file', {})
         filenames = _make_list(file.get('filename', []))
         toret = []
         for filename in filenames:
             for fn in glob.glob(filename):
-                if any(all(kw in filename for kw in keyword) for keyword in keywords):
+                if select_keywords is None or select_keywords(fn):
                     toret.append(fn)
         return toret
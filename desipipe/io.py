@@ -34,6 +34,9 @@ class BaseFile(BaseClass, metaclass=RegisteredFile):
         raise NotImplementedError('Implement save method in {}'.format(self.__class__.__name__))
 
 
+_registry = RegisteredFile._registry
+
+
 def get_filetype(filetype, path, *args, **kwargs):
     """
     Convenient function that returns a :class:`BaseFile` instance.
@@ -56,9 +59,12 @@ def get_filetype(filetype, path, *args, **kwargs):
     -------
     file : BaseFile
     """
+    cls = _registry.get(filetype, None)  # most common case: filetype is a name
+    if cls is not None:
+        return cls(path, *args, **kwargs)
     if isinstance(filetype, BaseFile):
         return filetype
-    return BaseFile._registry[filetype](path, *args, **kwargs)
+    raise KeyError(filetype)
 
 
 class TextFile(BaseFile):
@@ -78,15 +84,125 @@ class TextFile(BaseFile):
             file.write(txt)
 
 
+def _fadvise(path, advice):
+    """Pass ``advice`` (e.g. ``os.POSIX_FADV_WILLNEED``) on file ``path`` to the kernel; no-op where unsupported."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+_min_readahead_size = 1 << 20  # no need to hint the kernel for small files
+
+
+def _get_mpicomm(mpicomm=None):
+    """Return MPI communicator ``mpicomm``, defaulting to the world communicator (as :mod:`mpytools`)."""
+    if mpicomm is None:
+        from mpi4py import MPI
+        mpicomm = MPI.COMM_WORLD
+    return mpicomm
+
+
+def _load_columns(catalog):
+    """Read all columns of ``catalog`` into memory; :meth:`mpytools.Catalog.read` only reads a column when first accessed."""
+    for column in catalog.columns():
+        catalog[column]
+    return catalog
+
+
+def _read_catalog(path, readahead=False, drop_cache=False, **kwargs):
+    """Read catalog at ``path``, see :meth:`CatalogFile.load`."""
+    from mpytools import Catalog
+    # Each MPI rank only reads its slice of rows: prefetching the whole file on each node would multiply I/O
+    if readahead and hasattr(os, 'POSIX_FADV_WILLNEED') and _get_mpicomm(kwargs.get('mpicomm', None)).size == 1:
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            size = 0
+        if size > _min_readahead_size:
+            _fadvise(path, os.POSIX_FADV_WILLNEED)
+    catalog = Catalog.read(path, **kwargs)
+    if drop_cache and hasattr(os, 'POSIX_FADV_DONTNEED'):
+        _load_columns(catalog)  # pages are only dropped once all data has been read
+        # Ranks on the same node read the same file: wait for all of them before dropping pages (of each node)
+        _get_mpicomm(kwargs.get('mpicomm', None)).barrier()
+        _fadvise(path, os.POSIX_FADV_DONTNEED)
+    return catalog
+
+
+_catalog_cache, _catalog_cache_size = {}, 4  # dict order: least recently used first
+
+
+def _read_catalog_cached(path, kwargs, readahead=False, drop_cache=False):
+    """
+    Same as :func:`_read_catalog`, but keeping the last catalogs read in memory (with all columns loaded),
+    identified by their absolute path, modification time and ``kwargs`` (tuple of items).
+    Return a shallow copy of the cached catalog.
+    """
+    mtime = os.stat(path).st_mtime
+    key = (path, mtime, kwargs)
+    catalog = _catalog_cache.pop(key, None)
+    if catalog is None:
+        for kk in [kk for kk in _catalog_cache if kk[0] == path and kk[1] != mtime]:  # file was modified
+            del _catalog_cache[kk]
+        catalog = _load_columns(_read_catalog(path, readahead=readahead, drop_cache=drop_cache, **dict(kwargs)))
+        while len(_catalog_cache) >= _catalog_cache_size:
+            del _catalog_cache[next(iter(_catalog_cache))]
+    _catalog_cache[key] = catalog
+    return catalog.copy()
+
+
 class CatalogFile(BaseFile):
 
     """Catalog file."""
     name = 'catalog'
 
-    def load(self, **kwargs):
-        """Load catalog."""
-        from mpytools import Catalog
-        return Catalog.read(self.path, **kwargs)
+    def load(self, readahead=False, drop_cache=False, cache=False, **kwargs):
+        """
+        Load catalog.
+
+        Parameters
+        ----------
+        readahead : bool, default=False
+            If ``True``, ask the kernel to start reading the (large enough) file into the page cache
+            before :class:`mpytools.Catalog` parses it; useful for large catalogs on network file systems.
+            The whole file is prefetched, so this only makes sense if all of it is read, by a single process:
+            the hint is ignored if the MPI communicator has more than one process.
+
+        drop_cache : bool, default=False
+            If ``True``, read all columns into memory (instead of when first accessed), then, once all processes
+            of the MPI communicator are done, tell the kernel the file pages can be evicted from the page cache.
+            Useful for large catalogs read only once (e.g. randoms), which would otherwise evict more useful pages.
+            Avoid if processes outside the MPI communicator read the same file at the same time.
+
+        cache : bool, default=False
+            If ``True``, read all columns into memory and keep the last (4) catalogs read, such that subsequent loads
+            of the same file (e.g. randoms shared by several tasks run by the same worker) do not read it again.
+            The file is read again if it was modified in the meantime.
+            A shallow copy of the catalog is returned: adding / removing columns is safe, but modifying column arrays in place
+            modifies them in the cache as well.
+
+        **kwargs : dict
+            Other arguments for :meth:`mpytools.Catalog.read`.
+        """
+        if cache:
+            key = tuple(sorted(kwargs.items()))
+            try:
+                hash(key)
+            except TypeError:  # unhashable arguments, do not cache
+                pass
+            else:
+                path = os.path.abspath(self.path)
+                return _read_catalog_cached(path, key, readahead=readahead, drop_cache=drop_cache)
+        return _read_catalog(self.path, readahead=readahead, drop_cache=drop_cache, **kwargs)
 
     def save(self, catalog, **kwargs):
         """Save catalog."""
@@ -100,13 +216,15 @@ class PowerSpectrumFile(BaseFile):
 
     def load(self, *select, mode='poles'):
         """Load power spectrum."""
+        import numpy as np
         from pypower import MeshFFTPower, PowerSpectrumStatistics
         with utils.LoggingContext(level='warning'):
-            toret = MeshFFTPower.load(self.path)
-            try:
-                toret = getattr(toret, mode)
-            except AttributeError:
-                toret = PowerSpectrumStatistics.load(self.path)
+            # Read the saved state only once, then dispatch on its content
+            state = np.load(self.path, allow_pickle=True)[()]
+            if mode in state:  # MeshFFTPower
+                toret = getattr(MeshFFTPower.from_state(state), mode)
+            else:
+                toret = PowerSpectrumStatistics.from_state(state)
         if select:
             toret = toret.select(*select)
         return toret
@@ -108,11 +108,20 @@ class BaseProvider(BaseClass, metaclass=RegisteredProvider):
         """Number of running workers."""
         return len(self.jobids(state=state))
 
+    def snapshot(self):
+        """
+        Return dictionary mapping 'PENDING' and 'RUNNING' to the corresponding lists of (jobid, nworkers), from oldest to newest.
+        Override to obtain all states from a single query.
+        """
+        return {state: list(self.jobids(state=state, return_nworkers=True)) for state in ['PENDING', 'RUNNING']}
+
     def cost(self, workers=1):
         """
         Compute cost associated to the input number of workers (in addition to running ones).
         Only cost variations matter (not the absolute cost):
         constant cost triggers more workers, increasing cost penalizes more workers.
+        Costs are evaluated at the beginning of a scheduling step: "running ones" do not include
+        the workers submitted in the same step (which are all submitted at the end, with :meth:`submit_batch`).
         """
         return 0
 
@@ -120,6 +129,19 @@ class BaseProvider(BaseClass, metaclass=RegisteredProvider):
         """Submit input command ``cmd`` on ``workers`` workers."""
         raise NotImplementedError
 
+    def submit_batch(self, tosubmit):
+        """
+        Submit a batch of commands at once.
+        Override to amortize per-submission costs (e.g. environment setup).
+
+        Parameters
+        ----------
+        tosubmit : list
+            List of (``cmd``, ``workers``) tuples, see :meth:`__call__`.
+        """
+        for cmd, workers in tosubmit:
+            self(cmd, workers=workers)
+
     @property
     def timeout(self):
         """Job times out after this number of seconds."""
@@ -191,13 +213,18 @@ class LocalProvider(BaseProvider):
 
     def __call__(self, cmd, workers=1):
         """Submit input command ``cmd`` on ``workers`` workers."""
+        self.submit_batch([(cmd, workers)])
+
+    def submit_batch(self, tosubmit):
+        """Submit a batch of (``cmd``, ``workers``) commands, setting up the environment only once."""
         environ = {**os.environ, **self.environ.to_dict(all=True)}
-        for worker in range(workers):
-            tmp = cmd
+        for cmd, workers in tosubmit:
             if self.mpiprocs_per_worker > 1:
-                tmp = self.mpiexec.format(mpiprocs=self.mpiprocs_per_worker, cmd=tmp)
-            self.processes.append(subprocess.Popen(split(tmp), start_new_session=True, env=environ))
-            #time.sleep(random.uniform(0.8, 1.2))
+                cmd = self.mpiexec.format(mpiprocs=self.mpiprocs_per_worker, cmd=cmd)
+            cmd = split(cmd)
+            for worker in range(workers):
+                self.processes.append(subprocess.Popen(cmd, start_new_session=True, env=environ))
+                #time.sleep(random.uniform(0.8, 1.2))
 
     def clear(self):
         """Clear, i.e. delete information (processes) from current run."""
@@ -268,6 +295,39 @@ def decode_slurm_time(s):
     return tuple(days_hours_minutes_seconds)
 
 
+_sqs_cache = {}  # sqs command: (time bucket, number of submissions, output lines)
+_nsubmitted = 0  # number of sbatch submissions (by all :class:`SlurmProvider` instances)
+
+
+def _run_sqs(sqs, dt=2.):
+    """
+    Return output lines of the Slurm job query command ``sqs`` (tuple).
+    Cached at module level for ``dt`` seconds, such that all :class:`SlurmProvider` instances (e.g. one per task manager)
+    share the same query; any new submission triggers a new query.
+    """
+    sqs = tuple(sqs)
+    stamp = (get_ttl_hash(dt=dt), _nsubmitted)
+    cached = _sqs_cache.get(sqs, None)
+    if cached is None or cached[:2] != stamp:
+        lines = tuple(subprocess.run(list(sqs), check=True, stdout=subprocess.PIPE, text=True).stdout.split('\n'))
+        cached = _sqs_cache[sqs] = stamp + (lines,)  # only keep the last query
+    return cached[2]
+
+
+def _parse_sqs(sqs):
+    """Return dictionary of job ID: state ('PENDING' or 'RUNNING') from output lines of :func:`_run_sqs`."""
+    toret = {}
+    for line in sqs[2:]:
+        if line:
+            state = line.split()[1].strip()
+            jobid = line.split()[0].strip()
+            if state == 'RUNNING':
+                toret[jobid] = 'RUNNING'
+            elif state in ('PENDING', 'REQUEUED', 'RESIZING', 'REVOKED', 'SUSPENDED', 'PENDING+', 'REQUEUED+', 'RESIZING+', 'REVOKED+', 'SUSPENDED+'): # https://slurm.schedmd.com/sacct.html#SECTION_JOB-STATE-CODES
+                toret[jobid] = 'PENDING'
+    return toret
+
+
 class SlurmProvider(BaseProvider):
     """
     Slurm provider: input commands are submitted as Slurm jobs.
@@ -299,6 +359,7 @@ class SlurmProvider(BaseProvider):
         Template to run a command with MPI.
     """
     name = 'slurm'
+    _max_concurrent_sbatch = 4  # maximum number of sbatch commands run at the same time
     _defaults = {**BaseProvider._defaults, 'sqs': None, 'qos': 'regular', 'time': '01:00:00', 'nodes_per_worker': 1., 'mpiprocs_per_worker': 1, 'output': '/dev/null', 'error': '/dev/null', 'mpiexec': 'srun --unbuffered -N {nodes:d} -n {mpiprocs:d} {cmd}', 'signal': 'SIGTERM@30', 'killed_at_timeout': None, 'kwargs': {}}
 
     def update(self, **kwargs):
@@ -333,10 +394,8 @@ class SlurmProvider(BaseProvider):
         if jobids:
             subprocess.run(['scancel'] + [str(jobid) for jobid in jobids])
 
-    def __call__(self, cmd, workers=1):
-        """Submit input command ``cmd`` on ``workers`` workers."""
-        if self.nodes_per_worker <= 0.:
-            raise ValueError('Cannot set nodes_per_worker <= 0.')
+    def _job_cmd(self, cmd, workers=1):
+        """Return command to be run in the Slurm job for input command ``cmd`` on ``workers`` workers."""
         nodes = self.nodes(workers=workers)
         if int(self.nodes_per_worker) != self.nodes_per_worker:  # stack jobs
             cmd = self.mpiexec.format(nodes=nodes, mpiprocs=self.mpiprocs_per_worker * workers, cmd=cmd) + ' --mpisplits {:d}'.format(workers)
@@ -344,14 +403,46 @@ class SlurmProvider(BaseProvider):
             cmd = [self.mpiexec.format(nodes=int(self.nodes_per_worker), mpiprocs=self.mpiprocs_per_worker, cmd=cmd)] * workers
             cmd = ' & '.join(cmd)
             if workers: cmd += ' & wait'
-        cmd = self.environ.to_script(sep=' ; ') + ' ; ' + cmd
+        return cmd
+
+    def _sbatch_cmd(self, cmd, workers=1):
+        """Return sbatch command and number of nodes to submit input command ``cmd`` on ``workers`` workers."""
+        if self.nodes_per_worker <= 0.:
+            raise ValueError('Cannot set nodes_per_worker <= 0.')
+        nodes = self.nodes(workers=workers)
+        cmd = self.environ.to_script(sep=' ; ') + ' ; ' + self._job_cmd(cmd, workers=workers)
         kwargs = []
         for name, value in self.kwargs.items(): kwargs += ['--{}'.format(name), str(value)]
         # -- parsable to get jobid (optionally, cluster name)
         # -- wrap to pass the job
         cmd = ['sbatch', '--output', self.output, '--error', self.error, '--account', str(self.account), '--constraint', str(self.constraint), '--qos', str(self.qos), '--time', str(self.time), '--nodes', str(nodes), '--signal', str(self.signal), '--parsable'] + kwargs + ['--wrap', cmd]
-        proc = subprocess.run(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
-        self.processes.append((proc.stdout.split(',')[0].strip(), nodes, workers))  # jobid, workers
+        return cmd, nodes
+
+    def __call__(self, cmd, workers=1):
+        """Submit input command ``cmd`` on ``workers`` workers."""
+        self.submit_batch([(cmd, workers)])
+
+    def submit_batch(self, tosubmit):
+        """
+        Submit a batch of (``cmd``, ``workers``) commands.
+        sbatch commands are run concurrently, by waves of :attr:`_max_concurrent_sbatch` (not to overload the Slurm controller),
+        and job IDs are collected in submission order. Failed submissions are logged and not recorded.
+        """
+        global _nsubmitted
+        tosubmit = list(tosubmit)
+        if tosubmit: _nsubmitted += 1  # invalidate cached job queries
+        for start in range(0, len(tosubmit), self._max_concurrent_sbatch):
+            procs = []
+            for cmd, workers in tosubmit[start:start + self._max_concurrent_sbatch]:
+                cmd, nodes = self._sbatch_cmd(cmd, workers=workers)
+                procs.append((subprocess.Popen(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True), nodes, workers))
+            for proc, nodes, workers in procs:
+                stdout, stderr = proc.communicate()
+                jobid = stdout.split(',')[0].strip()
+                if proc.returncode != 0 or not jobid:
+                    self.log_error('sbatch failed (return code {:d}): {}'.format(proc.returncode, stderr.strip()))
+                    continue
+                self.processes.append((jobid, nodes, workers))  # jobid, workers
 
     def clear(self):
         """Clear, i.e. delete information (processes) from current run."""
@@ -372,24 +463,38 @@ class SlurmProvider(BaseProvider):
             if state not in allowed_state:
                 raise ValueError('state must be one of {}, found {}'.format(allowed_state, state))
         try:
-            sqs = subprocess.run(self.get_sqs(), check=True, stdout=subprocess.PIPE, text=True).stdout.split('\n')
+            sqs = _run_sqs(tuple(self.get_sqs()))
         except subprocess.CalledProcessError:
             jobids = getattr(self, '_jobids', [])
         else:
-            jobids = []
-            for line in sqs[2:]:
-                if line:
-                    state = line.split()[1].strip()
-                    jobid = line.split()[0].strip()
-                    if 'RUNNING' in states and state == 'RUNNING':
-                        jobids.append(jobid)
-                    elif 'PENDING' in states and state in ('PENDING', 'REQUEUED', 'RESIZING', 'REVOKED', 'SUSPENDED', 'PENDING+', 'REQUEUED+', 'RESIZING+', 'REVOKED+', 'SUSPENDED+'): # https://slurm.schedmd.com/sacct.html#SECTION_JOB-STATE-CODES
-                        jobids.append(jobid)
-            self._jobids = jobids = [jobid[0] for jobid in self.processes if jobid[0] in jobids]
+            sqs_states = _parse_sqs(sqs)
+            self._jobids = jobids = [jobid[0] for jobid in self.processes if sqs_states.get(jobid[0], None) in states]
         if return_nworkers:
             return [(jobid, workers) for jobid, nodes, workers in self.processes if jobid in jobids]
         return jobids
 
+    def snapshot(self):
+        """
+        Return dictionary mapping 'PENDING' and 'RUNNING' to the corresponding lists of (jobid, nworkers), from oldest to newest.
+        All states are obtained from a single job query.
+        """
+        try:
+            sqs = _run_sqs(tuple(self.get_sqs()))
+        except subprocess.CalledProcessError:
+            toret = getattr(self, '_snapshot', None)
+            if toret is None:  # no previous snapshot; last known active jobs, counted once, as pending
+                jobids = getattr(self, '_jobids', [])
+                toret = {'PENDING': [(jobid, workers) for jobid, nodes, workers in self.processes if jobid in jobids], 'RUNNING': []}
+            return toret
+        sqs_states = _parse_sqs(sqs)
+        toret = {'PENDING': [], 'RUNNING': []}
+        for jobid, nodes, workers in self.processes:
+            state = sqs_states.get(jobid, None)
+            if state is not None:
+                toret[state].append((jobid, workers))
+        self._snapshot = toret
+        return toret
+
     @time_lru_cache(dt=2.)
     def nworkers(self, of='workers', state=('PENDING', 'RUNNING')):
         """Number of (pending or running) workers."""
@@ -450,29 +555,12 @@ class NERSCProvider(SlurmProvider):
             return 0
         return nodes - self.threshold_nodes
 
-    def __call__(self, cmd, workers=1):
+    def _job_cmd(self, cmd, workers=1):
         """
-        Submit input command ``cmd`` on ``workers`` workers.
+        Return command to be run in the Slurm job for input command ``cmd`` on ``workers`` workers.
         In case we stack multiple parallel single-process jobs, we use GNU parallel.
         Indeed, in case of bash_app, this avoids spawning a subprocess from an MPI application, which is undefined behavior.
         """
-        if self.nodes_per_worker <= 0.:
-            raise ValueError('Cannot set nodes_per_worker <= 0.')
-        nodes = self.nodes(workers=workers)
-        if int(self.nodes_per_worker) != self.nodes_per_worker:  # stack jobs
-            if self.mpiprocs_per_worker == 1:
-                cmd = ' ; '.join(['module load parallel', 'seq {:d} | parallel -n0 {}'.format(workers, cmd)])
-            else:
-                cmd = self.mpiexec.format(nodes=nodes, mpiprocs=self.mpiprocs_per_worker * workers, cmd=cmd) + ' --mpisplits {:d}'.format(workers)
-        else:
-            cmd = [self.mpiexec.format(nodes=int(self.nodes_per_worker), mpiprocs=self.mpiprocs_per_worker, cmd=cmd)] * workers
-            cmd = ' & '.join(cmd)
-            if workers: cmd += ' & wait'
-        cmd = self.environ.to_script(sep=' ; ') + ' ; ' + cmd
-        kwargs = []
-        for name, value in self.kwargs.items(): kwargs += ['--{}'.format(name), str(value)]
-        # -- parsable to get jobid (optionally, cluster name)
-        # -- wrap to pass the job
-        cmd = ['sbatch', '--output', self.output, '--error', self.error, '--account', str(self.account), '--constraint', str(self.constraint), '--qos', str(self.qos), '--time', str(self.time), '--nodes', str(nodes), '--signal', str(self.signal), '--parsable'] + kwargs + ['--wrap', cmd]
-        proc = subprocess.run(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
-        self.processes.append((proc.stdout.split(',')[0].strip(), nodes, workers))  # jobid, workers
\ No newline at end of file
+        if int(self.nodes_per_worker) != self.nodes_per_worker and self.mpiprocs_per_worker == 1:  # stack jobs
+            return ' ; '.join(['module load parallel', 'seq {:d} | parallel -n0 {}'.format(workers, cmd)])
+        return super(NERSCProvider, self)._job_cmd(cmd, workers=workers)
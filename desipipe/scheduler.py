@@ -10,6 +10,8 @@ class RegisteredScheduler(type(BaseClass)):
 
     def __new__(meta, name, bases, class_dict):
         cls = super().__new__(meta, name, bases, class_dict)
+        # Types to cast input attributes to, in :meth:`BaseScheduler.update`
+        cls._types = {name: type(value) for name, value in cls._defaults.items()}
         meta._registry[cls.name] = cls
         return cls
 
@@ -41,14 +43,15 @@ class BaseScheduler(BaseClass, metaclass=RegisteredScheduler):
         """Update scheduler with input attributes."""
         if 'provider' in kwargs:
             self.provider = kwargs.pop('provider', None)
+        types = self._types
         for name, value in kwargs.items():
-            if name in self._defaults:
-                vt = type(self._defaults[name])
-                try: value = vt(value)
-                except TypeError: pass
-                setattr(self, name, value)
-            else:
-                raise ValueError('Unrecognized argument {}; supports {}'.format(name, list(self._defaults)))
+            try:
+                vt = types[name]
+            except KeyError:
+                raise ValueError('Unrecognized argument {}; supports {}'.format(name, list(self._defaults))) from None
+            try: value = vt(value)
+            except TypeError: pass
+            setattr(self, name, value)
 
     def __call__(self, cmd, ntasks=None):
         """Schedule input command ``cmd``."""
@@ -97,14 +100,21 @@ class SimpleScheduler(BaseScheduler):
     ----------
     max_workers : int, default=1
         Maximum number of workers.
+
+    block_size : int, default=1
+        Workers are submitted by blocks of this size (e.g. the number of workers that fit on a node),
+        such that the provider receives few large jobs rather than many small ones.
+        The number of workers is rounded up to the next block boundary, within :attr:`max_workers`;
+        hence resources may be reserved for idle workers, e.g. 4 nodes for 1 task with ``block_size=4`` and ``nodes_per_worker=1``.
     """
     name = 'simple'
-    _defaults = dict(max_workers=1)
+    _defaults = dict(max_workers=1, block_size=1)
 
     def __call__(self, cmd, ntasks=None):
         if ntasks is None: ntasks = self.max_workers
         #print('BEFORE', ntasks)
-        npending = self.provider.nworkers(state='PENDING')
+        snapshot = self.provider.snapshot()  # single query of pending and running jobs
+        npending = sum(nworkers for jobid, nworkers in snapshot['PENDING'])
         nremaining = ntasks - npending  # remaining tasks to be launched
         #print('AFTER', ntasks, npending, self.max_workers)
         if nremaining == 0:
@@ -113,23 +123,32 @@ class SimpleScheduler(BaseScheduler):
         if nremaining < 0:
             nkill = 0
             tokill = []
-            for jobid, nworkers in list(self.provider.jobids(state='PENDING', return_nworkers=True))[::-1]:  # start from newest
+            for jobid, nworkers in snapshot['PENDING'][::-1]:  # start from newest
                 if nkill + nworkers <= abs(nremaining) and jobid is not None:
                     tokill.append(jobid)
                     nkill += nworkers
             self.provider.kill(*tokill)
             return -nkill
 
-        max_remaining_workers = self.max_workers - self.provider.nworkers()
-        spawn_workers = 0
+        max_remaining_workers = self.max_workers - npending - sum(nworkers for jobid, nworkers in snapshot['RUNNING'])
+        block_size = max(getattr(self, 'block_size', 1), 1)  # backward-compatibility with pickled schedulers
+        costs = {}  # cache of provider costs, for this call
+
+        def cost(workers):
+            if workers not in costs:
+                costs[workers] = self.provider.cost(workers=workers)
+            return costs[workers]
+
+        spawn_workers, tosubmit = 0, []
         while max_remaining_workers >= spawn_workers:
             ndiff = min(nremaining, max_remaining_workers) - spawn_workers
             if ndiff <= 0: break
-            best_workers, best_cost = 0, float('inf')
-            for best in range(1, ndiff + 1):
-                cost = self.provider.cost(workers=best)
-                if cost <= best_cost:
-                    best_workers, best_cost = best, cost
-            self.provider(cmd, workers=best_workers)
+            # Round up to the next block boundary, without exceeding max_workers
+            ndiff = min(-(-ndiff // block_size) * block_size, max_remaining_workers - spawn_workers)
+            candidates = list(range(block_size, ndiff + 1, block_size)) or [ndiff]
+            best_workers = min(reversed(candidates), key=cost)  # in case of equal costs, favor more workers
+            tosubmit.append((cmd, best_workers))
             spawn_workers += best_workers
+        if tosubmit:
+            self.provider.submit_batch(tosubmit)
         return spawn_workers
\ No newline at end of file
@@ -1778,7 +1778,7 @@ def work(queue, mid=None, tid=None, name=None, provider=None, mode='', mpicomm=N
             break
 
 
-def spawn(queue, timeout=3600 * 24, timestep=3., mode='', max_workers=None, spawn=False):
+def spawn(queue, timeout=3600 * 24, timestep=3., mode='', max_workers=None, spawn=False, max_backoff=8):
     """
     Distribute tasks to workers.
     If all queues are paused, the function terminates.
@@ -1793,6 +1793,7 @@ def spawn(queue, timeout=3600 * 24, timestep=3., mode='', max_workers=None, spaw
 
     timestep : float, default=3.
         Period (in seconds) at which the queue is queried for new tasks.
+        If nothing changes in the queues, this period is doubled at each step, up to ``max_backoff`` times ``timestep``.
 
     mode : str, default=''
         Processing mode.
@@ -1803,17 +1804,21 @@ def spawn(queue, timeout=3600 * 24, timestep=3., mode='', max_workers=None, spaw
 
     spawn : bool, default=False
         If ``True``, spawn a new manager process and exit this one.
+
+    max_backoff : int, default=8
+        Maximum factor by which ``timestep`` is increased when the queues are idle; 1 to disable backoff.
     """
     queues = get_queue(queue, create=False, one=False)
 
     if spawn:
-        subprocess.Popen(['desipipe', 'spawn', '--queue', ' '.join([queue.filename for queue in queues]), '--timeout', str(timeout), '--mode', str(mode)], start_new_session=True, env=os.environ)
+        subprocess.Popen(['desipipe', 'spawn', '--queue', ' '.join([queue.filename for queue in queues]), '--timeout', str(timeout), '--timestep', str(timestep), '--mode', str(mode), '--max-backoff', str(max_backoff)], start_new_session=True, env=os.environ)
         return
 
     t0 = time.time()
     qmanagers, qadded_processes = [{} for i in range(len(queues))], [set() for i in range(len(queues))]
     stop = False
     nsteps, stop_after_nsteps = 0, 10
+    backoff, last_status = 1, None
     while True:
         if (time.time() - t0) > timeout:
             break
@@ -1826,6 +1831,7 @@ def spawn(queue, timeout=3600 * 24, timestep=3., mode='', max_workers=None, spaw
             nsteps = 0
         nsteps += 1
         stop = True
+        status = []  # to detect whether anything changed since last step
         for (queue, managers, added_processes) in zip(queues, qmanagers, qadded_processes):
             pid = os.getpid()
             #if ('local', pid) not in added_processes:
@@ -1835,7 +1841,9 @@ def spawn(queue, timeout=3600 * 24, timestep=3., mode='', max_workers=None, spaw
                 continue
             if 'stop_at_error' in mode and queue.counts(state=TaskState.FAILED):
                 continue
-            if queue.counts(state=(TaskState.PENDING, TaskState.RUNNING)):
+            nactive = queue.counts(state=(TaskState.PENDING, TaskState.RUNNING))
+            status.append((queue.filename, nactive))
+            if nactive:
                 stop = False
             for manager in queue.managers():
                 if manager.id not in managers:
@@ -1848,13 +1856,21 @@ def spawn(queue, timeout=3600 * 24, timestep=3., mode='', max_workers=None, spaw
                         queue.set_task_state(tid, TaskState.UNKNOWN)
                 ntasks = queue.counts(mid=manager.id, state=TaskState.PENDING)
                 # print(ntasks, queue.counts(mid=manager.id, state=TaskState.PENDING), queue.counts(mid=manager.id, state=TaskState.WAITING), stop, flush=True)
+                status.append((manager.id, ntasks))
                 if ntasks:
-                    manager.spawn("desipipe work --queue {} --mid {} --mode {}".format(queue.filename, manager.id, mode), ntasks=ntasks)
+                    if manager.spawn("desipipe work --queue {} --mid {} --mode {}".format(queue.filename, manager.id, mode), ntasks=ntasks):
+                        status.append(None)  # jobs were spawned or killed
                     for jobid in manager.provider.jobids():
                         if jobid is not None and (manager.provider.name, jobid) not in added_processes:  # just to limit queries
                             added_processes.add((manager.provider.name, jobid))
                             queue.add_process(jobid, provider=manager.provider)
-        time.sleep(timestep * random.uniform(0.8, 1.2))
+        # Exponential backoff while tasks are pending / running but nothing changes
+        if stop or None in status or status != last_status:
+            backoff = 1
+        else:
+            backoff = min(2 * backoff, max(max_backoff, 1))
+        last_status = status
+        time.sleep(backoff * timestep * random.uniform(0.8, 1.2))
 
 
 def kill(queue=None, provider=None, jobid=None, state=None, **kwargs):
@@ -2130,8 +2146,9 @@ def action_from_args(action='work', args=None):
         parser.add_argument('--mode', type=str, required=False, default='', help='Processing mode; "stop_at_error" to stop as soon as a task is failed; "retry_at_timeout" to retry when time out; "no_stream" to not stream stderr/stdout during the tasks (helps when many jobs in parallel. "no_out" to not stream stderr/stdout and not save stdout.')
         parser.add_argument('--max-workers', type=int, required=False, default=None, help='Maximum number of workers, overrides scheduler max_workers')
         parser.add_argument('--spawn', action='store_true', help='Spawn a new manager process and exit this one')
+        parser.add_argument('--max-backoff', '--max_backoff', type=int, required=False, default=8, help='Maximum factor by which timestep is increased when the queues are idle; 1 to disable backoff')
         args = parser.parse_args(args=args)
-        return spawn(args.queue, timeout=args.timeout, mode=args.mode, max_workers=args.max_workers, spawn=args.spawn)
+        return spawn(args.queue, timeout=args.timeout, timestep=args.timestep, mode=args.mode, max_workers=args.max_workers, spawn=args.spawn, max_backoff=args.max_backoff)
 
     if action == 'retry':
 
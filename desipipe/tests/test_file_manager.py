@@ -101,7 +101,29 @@ def test_error():
         print(exc)
 
 
+def test_databases():
+    import os
+    config_dir = os.path.abspath('_tests/config_databases')
+    os.makedirs(config_dir, exist_ok=True)
+    filenames = [os.path.join(config_dir, fn) for fn in ['DB_Y1_abacus.yaml', 'DB_Y3_abacus.yaml']]
+    for fn in filenames:
+        with open(fn, 'w'): pass
+    with open(os.path.join(config_dir, 'config.yaml'), 'w') as file:
+        file.write('file:\n  filename: [{}]\n'.format(os.path.join(config_dir, 'DB_*.yaml')))  # glob pattern
+    config_dir_bak = os.environ.get('DESIPIPE_CONFIG_DIR', None)
+    os.environ['DESIPIPE_CONFIG_DIR'] = config_dir
+    try:
+        assert sorted(FileManager.databases()) == filenames  # used to raise with keywords=None
+        assert FileManager.databases(keywords='y1 abacus') == filenames[:1]  # case insensitive
+        assert sorted(FileManager.databases(keywords=['y1', 'Y3'])) == filenames
+        assert FileManager.databases(keywords='cubic') == []
+    finally:
+        if config_dir_bak is None: del os.environ['DESIPIPE_CONFIG_DIR']
+        else: os.environ['DESIPIPE_CONFIG_DIR'] = config_dir_bak
+
+
 if __name__ == '__main__':
 
     test_file_manager()
-    test_error()
\ No newline at end of file
+    test_error()
+    test_databases()
\ No newline at end of file
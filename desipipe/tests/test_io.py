@@ -1,4 +1,9 @@
-from desipipe.io import ChainFile, ProfilesFile
+import os
+import sys
+import types
+import contextlib
+
+from desipipe.io import ChainFile, ProfilesFile, CatalogFile
 
 
 def test_io():
@@ -14,6 +19,95 @@ def test_io():
     fi.load()
 
 
+class MockCatalog(object):
+    # Mimics lazy reading of mpytools.Catalog: columns are read from file when first accessed
+
+    events = []  # column reads (and other events to test their order)
+
+    def __init__(self, data, source):
+        self.data, self._source = data, source
+
+    @classmethod
+    def read(cls, filename, **kwargs):
+        return cls({}, filename)
+
+    def columns(self):
+        return ['RA', 'DEC']
+
+    def __getitem__(self, column):
+        if column not in self.data:
+            self.events.append(column)
+            self.data[column] = [0.]
+        return self.data[column]
+
+    def __setitem__(self, column, value):
+        self.data[column] = value
+
+    def copy(self):
+        return self.__class__(dict(self.data), self._source)
+
+
+@contextlib.contextmanager
+def mock_mpytools():
+    mpytools = sys.modules.get('mpytools', None)
+    sys.modules['mpytools'] = types.SimpleNamespace(Catalog=MockCatalog)
+    MockCatalog.events = []
+    try:
+        yield MockCatalog.events
+    finally:
+        if mpytools is None: del sys.modules['mpytools']
+        else: sys.modules['mpytools'] = mpytools
+
+
+def test_catalog_cache():
+
+    with mock_mpytools() as reads:
+        fn = '_tests/catalog.fits'
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        with open(fn, 'w'): pass
+        catalog = CatalogFile(fn).load(cache=True)
+        assert reads == ['RA', 'DEC']
+        catalog['Z'] = [1.]
+        catalog2 = CatalogFile(fn).load(cache=True, readahead=False)
+        assert catalog2['RA'] is catalog['RA']
+        assert reads == ['RA', 'DEC']  # not read again
+        assert 'Z' not in catalog2.data
+        os.utime(fn, (0, 0))  # file modified
+        CatalogFile(fn).load(cache=True)
+        assert reads == ['RA', 'DEC'] * 2
+        CatalogFile(fn).load()['RA']  # no cache
+        assert reads == ['RA', 'DEC'] * 2 + ['RA']
+
+
+def test_catalog_drop_cache():
+
+    if not hasattr(os, 'POSIX_FADV_DONTNEED'):
+        return
+
+    from desipipe import io
+
+    class MPIComm(object):
+
+        size, rank = 2, 0
+
+        def barrier(self):
+            events.append('barrier')
+
+    _fadvise = io._fadvise
+    io._fadvise = lambda path, advice: events.append(advice)
+    try:
+        with mock_mpytools() as events:
+            fn = '_tests/catalog.fits'
+            os.makedirs(os.path.dirname(fn), exist_ok=True)
+            with open(fn, 'w'): pass
+            CatalogFile(fn).load(drop_cache=True, mpicomm=MPIComm())
+            # Pages are dropped once all columns are read by all processes
+            assert events == ['RA', 'DEC', 'barrier', os.POSIX_FADV_DONTNEED]
+    finally:
+        io._fadvise = _fadvise
+
 if __name__ == '__main__':
 
-    test_io()
\ No newline at end of file
+    test_io()
+    test_catalog_cache()
+    test_catalog_drop_cache()
\ No newline at end of file
@@ -240,6 +240,90 @@ def test_slurm():
     assert decode_slurm_time('3-02:30:08') == (3, 2, 30, 8)
 
 
+def test_scheduler():
+    import pickle
+    from desipipe.provider import BaseProvider
+    from desipipe.scheduler import get_scheduler
+
+    class StubProvider(BaseProvider):
+
+        name = 'stub'
+
+        def __init__(self, *args, **kwargs):
+            super(StubProvider, self).__init__(*args, **kwargs)
+            self.submitted = []
+
+        def cost(self, workers=1):
+            return 0 if workers <= 4 else workers
+
+        def __call__(self, cmd, workers=1):
+            self.submitted.append(workers)
+
+    def submitted(ntasks, **kwargs):
+        provider = StubProvider()
+        get_scheduler('simple', provider=provider, **kwargs)('cmd', ntasks=ntasks)
+        return provider.submitted
+
+    assert submitted(10, max_workers=10, block_size=4) == [4, 4, 2]  # last chunk capped by max_workers
+    assert submitted(1, max_workers=10, block_size=4) == [4]  # rounded up to block size
+    assert submitted(10, max_workers=6, block_size=4) == [4, 2]  # last chunk capped by max_workers
+    assert submitted(9, max_workers=10) == [4, 4, 1]  # in case of equal costs, more workers
+    # Scheduler pickled before block_size was introduced
+    scheduler = pickle.loads(pickle.dumps(get_scheduler('simple', max_workers=10)))
+    del scheduler.block_size
+    provider = StubProvider()
+    scheduler.update(provider=provider)
+    scheduler('cmd', ntasks=5)
+    assert provider.submitted == [4, 1]
+
+
+def test_slurm_sqs_cache():
+    from desipipe import provider as provider_module
+    from desipipe.provider import get_provider
+    bin_dir = os.path.abspath(os.path.join(base_dir, 'bin'))
+    os.makedirs(bin_dir, exist_ok=True)
+    sbatch = os.path.join(bin_dir, 'sbatch')
+    with open(sbatch, 'w') as file:
+        file.write('#!/bin/sh\necho 1\n')
+    os.chmod(sbatch, 0o755)
+    counter = os.path.join(bin_dir, 'counter')
+    with open(counter, 'w'): pass
+    sqs = ['sh', '-c', 'echo >> {}; printf "JobID State\\n------\\n1 PENDING\\n"'.format(counter)]
+
+    def nqueries():
+        with open(counter, 'r') as file:
+            return len(file.read())
+
+    path_bak, get_ttl_hash = os.environ['PATH'], provider_module.get_ttl_hash
+    os.environ['PATH'] = bin_dir + os.pathsep + path_bak
+    provider_module.get_ttl_hash = lambda dt=1: 0  # same time period during the test
+    try:
+        provider, provider2 = get_provider('nersc', sqs=sqs), get_provider('nersc', sqs=sqs)
+        assert provider.snapshot() == provider2.snapshot() == {'PENDING': [], 'RUNNING': []}
+        assert nqueries() == 1  # query shared by both providers
+        provider.submit_batch([('echo', 1)])
+        assert provider.jobids() == ['1']  # new query after submission
+        assert nqueries() == 2
+    finally:
+        os.environ['PATH'] = path_bak
+        provider_module.get_ttl_hash = get_ttl_hash
+
+
+def test_slurm_snapshot():
+    from desipipe.provider import get_provider
+    provider = get_provider('slurm', sqs='false')  # failing job query
+    provider.processes = [('1', 1, 2), ('2', 1, 3)]  # jobid, nodes, workers
+    provider._jobids = ['1', '2']  # last known active jobs
+    snapshot = provider.snapshot()
+    # Active jobs are counted once
+    assert snapshot == {'PENDING': [('1', 2), ('2', 3)], 'RUNNING': []}
+    provider.update(sqs=['sh', '-c', 'printf "JobID State\\n------\\n1 RUNNING\\n2 PENDING\\n3 RUNNING\\n"'])
+    snapshot = provider.snapshot()
+    assert snapshot == {'PENDING': [('2', 3)], 'RUNNING': [('1', 2)]}
+    provider.update(sqs='false')
+    assert provider.snapshot() == snapshot  # last snapshot
+
+
 if __name__ == '__main__':
 
     #test_serialization()
@@ -248,4 +332,7 @@ if __name__ == '__main__':
     test_cmdline()
     #test_file(spawn=True)
     #test_mpi()
-    test_slurm()
\ No newline at end of file
+    test_slurm()
+    test_scheduler()
+    test_slurm_sqs_cache()
+    test_slurm_snapshot()
\ No newline at end of file